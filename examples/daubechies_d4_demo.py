@@ -10,13 +10,15 @@ This example demonstrates:
 import numpy as np
 import pennylane as qml
 
+from quantum_wavelets._backend import _make_device, _qjit
 from quantum_wavelets.daubechies_d4 import DaubechiesD4
 
 
 def run_state_demo(n_wires=3):
     """Apply D4 wavelet transform to a basis state."""
-    dev = qml.device("default.qubit", wires=n_wires)
+    dev = _make_device(n_wires)
 
+    @_qjit
     @qml.qnode(dev)
     def circuit():
         # Example basis state |010...0>
@@ -39,6 +41,7 @@ def run_state_demo(n_wires=3):
 
 def run_matrix_demo(n_wires=3):
     """Extract and verify the full D4 transform matrix."""
+    # qml.matrix only needs the tape; keep the reference simulator here.
     dev = qml.device("default.qubit", wires=n_wires)
 
     @qml.qnode(dev)
@@ -8,6 +8,7 @@ to a simple quantum state using PennyLane.
 import pennylane as qml
 import numpy as np
 
+from quantum_wavelets._backend import _make_device, _qjit
 from quantum_wavelets.haar import HaarWavelet
 
 
@@ -15,8 +16,9 @@ def main():
     n_wires = 3
     wires = list(range(n_wires))
 
-    dev = qml.device("default.qubit", wires=n_wires)
+    dev = _make_device(n_wires)
 
+    @_qjit
     @qml.qnode(dev)
     def circuit():
         # Prepare a basis state |100>
@@ -1,10 +1,14 @@
 from .haar import HaarWavelet
-from .daubechies_d4 import DaubechiesD4
+from .daubechies_d4 import D4Kernel, DaubechiesD4
 from .permutations import PerfectShuffle, BitReversal
+from ._transforms import absorb_shuffles, optimize_pipeline
 
 __all__ = [
     "HaarWavelet",
     "DaubechiesD4",
+    "D4Kernel",
     "PerfectShuffle",
     "BitReversal",
+    "absorb_shuffles",
+    "optimize_pipeline",
 ]
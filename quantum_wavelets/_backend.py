@@ -0,0 +1,63 @@
+# Copyright 2026
+# Apache License 2.0
+"""
+Simulator backend selection for quantum wavelet circuits.
+
+This module contains internal helper functions that are
+not part of the public API.
+"""
+
+from importlib.util import find_spec
+
+import numpy as np
+import pennylane as qml
+
+# Complex dtype of the simulated state vector. Single precision halves the
+# memory traffic of every gate application; set to ``np.complex128`` before
+# creating devices when double-precision results are needed.
+PRECISION = np.complex64
+
+
+def _make_device(n_wires, **kwargs):
+    """
+    Construct a state-vector simulator on ``n_wires`` qubits.
+
+    Prefers the C++ ``lightning.qubit`` backend, with state precision given
+    by :data:`PRECISION`, and falls back to ``default.qubit`` when
+    PennyLane-Lightning is not installed.
+
+    Note that ``qml.matrix`` does not need a device; verification code
+    extracting full unitaries should keep using ``default.qubit``.
+
+    Args:
+        n_wires (int): Number of qubits.
+        **kwargs: Extra keyword arguments forwarded to ``qml.device``.
+
+    Returns:
+        pennylane.devices.Device: Simulator device.
+    """
+    try:
+        return qml.device(
+            "lightning.qubit", wires=n_wires, **{"c_dtype": PRECISION, **kwargs}
+        )
+    except (qml.DeviceError, ImportError):
+        kwargs.pop("c_dtype", None)
+        return qml.device("default.qubit", wires=n_wires, **kwargs)
+
+
+def _qjit(qnode):
+    """
+    Compile ``qnode`` with Catalyst if it is installed, else return it as is.
+
+    Catalyst is an optional dependency (``pip install -e ".[catalyst]"``);
+    without it the QNode runs through the regular PennyLane interpreter.
+
+    Args:
+        qnode (QNode): Circuit to compile.
+
+    Returns:
+        QJIT or QNode: Compiled circuit, or ``qnode`` unchanged.
+    """
+    if find_spec("catalyst") is None:
+        return qnode
+    return qml.qjit(qnode)
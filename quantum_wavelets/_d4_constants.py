@@ -0,0 +1,49 @@
+# Copyright 2026
+# Apache License 2.0
+"""
+Precomputed constants of the Daubechies D4 quantum wavelet transform.
+
+All values are written as shortest round-trip (``repr``) literals, which
+parse back to exactly the same IEEE-754 doubles: importing this module
+performs no trigonometry and gives bit-identical kernels on every
+platform.
+
+This module contains internal constants that are
+not part of the public API.
+"""
+
+import numpy as np
+
+SQRT2 = 1.4142135623730951  # √2
+SQRT3 = 1.7320508075688772  # √3
+
+# Scaling coefficients h_k
+h0 = 0.4829629131445341  # (1 + √3) / (4√2)
+h1 = 0.8365163037378077  # (3 + √3) / (4√2)
+h2 = 0.2241438680420134  # (3 - √3) / (4√2)
+h3 = -0.12940952255126034  # (1 - √3) / (4√2)
+
+# Lattice angles: UD4 = (I ⊗ RY(THETA1)) · Q · (I ⊗ RY(THETA0))
+THETA0 = 1.0471975511965976  # π/3
+THETA1 = -0.5235987755982988  # -π/6
+
+
+def _frozen(rows):
+    """Contiguous read-only complex128 array, shared by every operation."""
+    array = np.ascontiguousarray(rows, dtype=np.complex128)
+    array.setflags(write=False)
+    return array
+
+
+# 2-qubit D4 kernel (unitary, det = +1)
+UD4 = _frozen(
+    [
+        [ h0,  h1,  h2,  h3],
+        [ h3, -h2,  h1, -h0],
+        [ h2,  h3, -h0, -h1],
+        [ h1, -h0, -h3,  h2],
+    ]
+)
+
+# Inverse kernel, preloaded for the adjoint transform
+UD4_ADJOINT = _frozen(UD4.conj().T)
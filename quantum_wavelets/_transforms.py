@@ -0,0 +1,222 @@
+# Copyright 2026
+# Apache License 2.0
+"""
+Tape transforms for quantum wavelet circuits.
+
+Implements:
+- ``absorb_shuffles``: remove perfect shuffles by relabelling wires
+- ``optimize_pipeline``: peephole compilation of wavelet circuits
+
+Permutations dominate the gate count of quantum wavelet transforms.
+On a simulator a qubit permutation needs no gates at all: it is enough to
+track where every logical qubit currently lives and to address later gates
+accordingly.
+"""
+
+from functools import partial
+
+from pennylane import compile as compile_circuit
+from pennylane import transform
+from pennylane.ops import SWAP, Adjoint
+from pennylane.tape import QuantumScript, QuantumScriptBatch
+from pennylane.transforms import (
+    cancel_inverses,
+    commute_controlled,
+    merge_rotations,
+)
+from pennylane.typing import PostprocessingFn
+
+from quantum_wavelets.daubechies_d4 import DaubechiesD4, _DaubechiesD4Adjoint
+from quantum_wavelets.haar import HaarWavelet, _HaarWaveletAdjoint
+from quantum_wavelets.permutations import PerfectShuffle
+
+# Operators expanded so that their inner perfect shuffles become visible
+_WAVELETS = (
+    HaarWavelet,
+    DaubechiesD4,
+    _HaarWaveletAdjoint,
+    _DaubechiesD4Adjoint,
+)
+
+# Gates the wavelet transforms are expanded into before optimization.
+# State preparations are kept so that they are not synthesized into gates,
+# and so are the zero-controlled levels of the Haar transform, which no
+# pass can cancel and which would expand into hundreds of gates.
+_NATIVE_GATES = (
+    "BasisState",
+    "StatePrep",
+    "C(Hadamard)",
+    "C(PerfectShuffle)",
+    "Hadamard",
+    "PauliX",
+    "RY",
+    "Rot",
+    "CZ",
+    "CNOT",
+    "SWAP",
+)
+
+
+def _expand_wavelets(op):
+    """Yield ``op``, replacing wavelet transforms (and adjoints) by their gates."""
+    base = op.base if isinstance(op, Adjoint) else op
+
+    if isinstance(base, _WAVELETS):
+        for sub_op in op.decomposition():
+            yield from _expand_wavelets(sub_op)
+    else:
+        yield op
+
+
+def _shuffle_shift(op):
+    """Return +1 for Π_{2^n}, -1 for its adjoint and 0 for any other operator."""
+    if isinstance(op, PerfectShuffle):
+        return 1
+    if isinstance(op, Adjoint) and isinstance(op.base, PerfectShuffle):
+        return -1
+    return 0
+
+
+def _restore_order(perm):
+    """SWAPs moving every logical wire back onto its own physical wire."""
+    where = dict(perm)
+    holder = {p: w for w, p in perm.items()}
+
+    swaps = []
+    for w in perm:
+        p = where[w]
+        if p == w:
+            continue
+
+        swaps.append(SWAP(wires=[p, w]))
+
+        other = holder[w]
+        where[other], holder[p] = p, other
+        where[w], holder[w] = w, w
+
+    return swaps
+
+
+def _null_postprocessing(results):
+    """Unpack the result of the single transformed tape."""
+    return results[0]
+
+
+@transform
+def absorb_shuffles(tape: QuantumScript) -> tuple[QuantumScriptBatch, PostprocessingFn]:
+    r"""
+    Remove uncontrolled ``PerfectShuffle`` gates by relabelling later wires.
+
+    The transform walks the tape once, expanding ``HaarWavelet`` and
+    ``DaubechiesD4``, and maintains a logical-to-physical wire map. Each
+    uncontrolled perfect shuffle (or its adjoint) only rotates this map;
+    every other operation is re-addressed through it. This removes the
+    :math:`n-1` SWAP gates of every shuffle of ``DaubechiesD4``, i.e.
+    :math:`O(n^2)` SWAPs per transform.
+
+    The shuffles of ``HaarWavelet`` beyond its first level are
+    zero-controlled and cannot become a relabelling, so they are kept:
+    a single shuffle is absorbed per Haar transform.
+
+    If all measurements act on explicit wires they are relabelled too.
+    Otherwise (e.g. ``qml.state()``) at most :math:`n-1` SWAPs are
+    appended to restore the original qubit order.
+
+    Args:
+        tape (QNode or QuantumScript or Callable): quantum circuit to transform
+
+    Returns:
+        qnode (QNode) or quantum function (Callable) or tuple[List[QuantumScript], function]:
+        the transformed circuit
+
+    **Example**
+
+    .. code-block:: python
+
+        @absorb_shuffles
+        @qml.qnode(dev)
+        def circuit():
+            DaubechiesD4(wires=range(4))
+            return qml.probs(wires=range(4))
+
+    It composes with PennyLane's compilation passes, e.g.
+    ``qml.compile(pipeline=[absorb_shuffles, single_qubit_fusion])``.
+    """
+    # logical wire -> physical wire holding it
+    perm = {w: w for w in tape.wires}
+
+    new_ops = []
+    for op in tape.operations:
+        for sub_op in _expand_wavelets(op):
+            shift = _shuffle_shift(sub_op)
+
+            if not shift:
+                new_ops.append(sub_op.map_wires(perm))
+                continue
+
+            # Π moves the qubit on wires[k - 1] to wires[k]
+            wires = sub_op.wires
+            physical = [perm[w] for w in wires]
+            for k, w in enumerate(wires):
+                perm[w] = physical[(k - shift) % len(wires)]
+
+    if all(len(mp.wires) > 0 for mp in tape.measurements):
+        new_measurements = [mp.map_wires(perm) for mp in tape.measurements]
+    else:
+        new_ops.extend(_restore_order(perm))
+        new_measurements = tape.measurements
+
+    new_tape = tape.copy(operations=new_ops, measurements=new_measurements)
+
+    return [new_tape], _null_postprocessing
+
+
+def optimize_pipeline(qnode):
+    r"""
+    Compile a wavelet circuit with PennyLane's peephole passes.
+
+    The wavelet transforms are first expanded to native gates, after which
+    ``cancel_inverses``, ``merge_rotations`` and
+    ``commute_controlled(direction="left")`` are applied repeatedly. In
+    forward/adjoint round trips every cancellation exposes the next pair:
+    the SWAP chains of adjacent perfect shuffles cancel, and the ``RY``
+    rotations of a D4 kernel and of its inverse merge to nothing, so a
+    ``DaubechiesD4`` round trip compiles to an empty circuit.
+
+    ``HaarWavelet`` is only expanded down to its zero-controlled levels,
+    which no pass cancels, so a Haar round trip keeps all of its gates.
+    A single forward transform contains no inverse pairs and is left as
+    it is, so the pipeline is meant for composed transforms.
+
+    Operations other than the gates in ``_NATIVE_GATES`` are decomposed as
+    well, e.g. a ``QubitUnitary`` into ``Rot`` gates.
+
+    Args:
+        qnode (QNode or QuantumScript or Callable): quantum circuit to optimize
+
+    Returns:
+        qnode (QNode) or quantum function (Callable) or tuple[List[QuantumScript], function]:
+        the compiled circuit
+
+    **Example**
+
+    .. code-block:: python
+
+        @optimize_pipeline
+        @qml.qnode(dev)
+        def circuit():
+            DaubechiesD4(wires=range(4))
+            qml.adjoint(DaubechiesD4(wires=range(4)))
+            return qml.state()
+    """
+    return compile_circuit(
+        qnode,
+        pipeline=[
+            cancel_inverses,
+            merge_rotations,
+            partial(commute_controlled, direction="left"),
+        ],
+        basis_set=list(_NATIVE_GATES),
+        # Round trips unwind from the middle, one layer of gates per pass
+        num_passes=10,
+    )
@@ -1,42 +1,164 @@
-import numpy as np
+import functools
+
 import pennylane as qml
+from pennylane import math
+from pennylane.control_flow import for_loop
+from pennylane.decomposition import add_decomps, register_resources, resource_rep
 from pennylane.operation import Operation
-from pennylane.wires import Wires
+from pennylane.wires import Wires, WiresLike
 
+from quantum_wavelets._d4_constants import THETA0, THETA1, UD4, UD4_ADJOINT
 from quantum_wavelets.permutations import PerfectShuffle
+from quantum_wavelets.utils import TemplateOperation
+
+# Lattice factorization used by the circuit:
+#
+#     UD4 = (I ⊗ C1) · Q · (I ⊗ C0)
+#
+# with Givens rotations C0 = RY(THETA0), C1 = RY(THETA1) on the second
+# (low) qubit and Q = CNOT · X · CZ the signed cyclic down-shift of the
+# 2-qubit basis. Named gates hit the simulators' specialized kernels
+# instead of the generic dense QubitUnitary path.
+_D4_KERNEL_GATES = (
+    (functools.partial(qml.RY, THETA0), (1,)),
+    (qml.CZ, (0, 1)),
+    (qml.PauliX, (1,)),
+    (qml.CNOT, (1, 0)),
+    (functools.partial(qml.RY, THETA1), (1,)),
+)
+
+# Inverse kernel: the same gates in reverse order with negated angles
+_D4_KERNEL_ADJOINT_GATES = (
+    (functools.partial(qml.RY, -THETA1), (1,)),
+    (qml.CNOT, (1, 0)),
+    (qml.PauliX, (1,)),
+    (qml.CZ, (0, 1)),
+    (functools.partial(qml.RY, -THETA0), (1,)),
+)
+
+
+class D4Kernel(Operation):
+    r"""
+    D4Kernel(wires)
+
+    The 2-qubit Daubechies D4 kernel :math:`U_{D4}` as a named operation.
+
+    Simulators with a dense-matrix path apply ``UD4`` directly; all others
+    use the analytic lattice decomposition into ``RY``, ``CZ``,
+    ``PauliX``, ``CNOT`` and ``RY``.
+    """
+
+    num_wires = 2
+    num_params = 0
+    grad_method = None
+    resource_keys = set()
+
+    @staticmethod
+    def compute_matrix():
+        return UD4
+
+    @staticmethod
+    def compute_decomposition(wires: WiresLike):
+        wires = Wires(wires)
+
+        return [
+            make(wires=wires.subset(positions))
+            for make, positions in _D4_KERNEL_GATES
+        ]
+
+    def adjoint(self):
+        return _D4KernelAdjoint(wires=self.wires)
+
+    @property
+    def resource_params(self):
+        return {}
+
+
+class _D4KernelAdjoint(Operation):
+    r"""
+    Inverse D4 kernel :math:`U_{D4}^\dagger`, decomposed without ``Adjoint`` wrappers.
+    """
+
+    num_wires = 2
+    num_params = 0
+    grad_method = None
+    resource_keys = set()
+
+    @staticmethod
+    def compute_matrix():
+        return UD4_ADJOINT
+
+    @staticmethod
+    def compute_decomposition(wires: WiresLike):
+        wires = Wires(wires)
+
+        return [
+            make(wires=wires.subset(positions))
+            for make, positions in _D4_KERNEL_ADJOINT_GATES
+        ]
+
+    def adjoint(self):
+        return D4Kernel(wires=self.wires)
+
+    @property
+    def resource_params(self):
+        return {}
+
 
 # ============================================================
-# Daubechies D4 2-qubit kernel (unitary, det = +1)
+# Decomposition template (depends only on the number of wires)
 # ============================================================
 
-SQRT2 = np.sqrt(2)
-SQRT3 = np.sqrt(3)
-
-h0 = (1 + SQRT3) / (4 * SQRT2)
-h1 = (3 + SQRT3) / (4 * SQRT2)
-h2 = (3 - SQRT3) / (4 * SQRT2)
-h3 = (1 - SQRT3) / (4 * SQRT2)
-
-UD4 = np.array(
-    [
-        [ h0,  h1,  h2,  h3],
-        [ h3, -h2,  h1, -h0],
-        [ h2,  h3, -h0, -h1],
-        [ h1, -h0, -h3,  h2],
-    ],
-    dtype=complex,
-)
+@functools.lru_cache(maxsize=None)
+def _d4_ops_template(n_wires):
+    """
+    Gate sequence of :math:`D_{2^n}^4` as ``(factory, wire positions)`` pairs.
+
+    Positions index into the operator's wires, so a single template
+    serves every wire labelling with the same ``n_wires``.
+    """
+    template = []
+
+    active = tuple(range(n_wires))
+
+    # Multiresolution stages
+    while len(active) >= 2:
+
+        # 1. Apply D4 kernels on adjacent pairs
+        template.extend(
+            (D4Kernel, (active[i], active[i + 1]))
+            for i in range(0, len(active) - 1, 2)
+        )
+
+        # 2. Perfect shuffle permutation
+        template.append((PerfectShuffle, active))
 
-# Sanity check (optional, safe to keep)
-# assert np.allclose(UD4.conj().T @ UD4, np.eye(4))
-# assert np.isclose(np.linalg.det(UD4), 1.0)
+        # 3. Keep low-frequency half (even indices)
+        active = active[::2]
+
+    return tuple(template)
+
+
+@functools.lru_cache(maxsize=None)
+def _d4_adjoint_ops_template(n_wires):
+    """
+    Gate sequence of the inverse transform: the forward template reversed,
+    with every kernel inverted and every shuffle applied to its wires in
+    reverse order (which is the inverse cyclic shift).
+    """
+    return tuple(
+        (PerfectShuffle, positions[::-1])
+        if make is PerfectShuffle
+        else (_D4KernelAdjoint, positions)
+        for make, positions in reversed(_d4_ops_template(n_wires))
+    )
 
 
 # ============================================================
 # General Daubechies D4 Transform  D_{2^n}^4
 # ============================================================
 
-class DaubechiesD4(Operation):
+class DaubechiesD4(TemplateOperation):
     r"""
     General Daubechies D4 quantum wavelet transform :math:`D_{2^n}^4`.
 
@@ -50,57 +172,116 @@ class DaubechiesD4(Operation):
     Works for any number of qubits n >= 2.
     """
 
-    num_params = 0
-    grad_method = None
-
-    def __init__(self, wires, id=None):
-        wires = Wires(wires)
-
-        if len(wires) < 2:
-            raise ValueError("DaubechiesD4 requires at least 2 qubits.")
+    min_wires = 2
 
-        super().__init__(wires=wires, id=id)
+    _ops_template = staticmethod(_d4_ops_template)
 
     # --------------------------------------------------------
-    # Decomposition (this is the ONLY thing PennyLane needs)
+    # qfunc decomposition (for JAX / capture / Catalyst)
     # --------------------------------------------------------
     @staticmethod
-    def compute_decomposition(*params, wires, **kwargs):
-        """
-        Multiscale Daubechies D4 decomposition.
-
-        IMPORTANT:
-        - Signature MUST accept *params and **kwargs
-        - Do NOT introduce custom hyperparameters here
-        """
-
-        wires = Wires(wires)
-        ops = []
-
-        active_wires = list(wires)
+    def compute_qfunc_decomposition(*wires, n_wires):
+        wires = math.array(wires, like="jax")
 
-        # Multiresolution stages
-        while len(active_wires) >= 2:
+        # The number of scales depends only on n_wires, so the outer loop
+        # is unrolled at trace time; the kernel layer is a traced loop.
+        step = 1
+        while step < n_wires:
+            active_wires = wires[::step]
 
-            # 1. Apply D4 kernels on adjacent pairs
-            for i in range(0, len(active_wires) - 1, 2):
-                ops.append(
-                    qml.QubitUnitary(
-                        UD4,
-                        wires=[active_wires[i], active_wires[i + 1]],
-                    )
-                )
+            @for_loop(len(range(0, n_wires, step)) // 2)
+            def kernels(i):
+                D4Kernel(wires=[active_wires[2 * i], active_wires[2 * i + 1]])
 
-            # 2. Perfect shuffle permutation
-            ops.append(PerfectShuffle(wires=active_wires))
+            kernels()
 
-            # 3. Keep low-frequency half (even indices)
-            active_wires = active_wires[::2]
+            PerfectShuffle(wires=active_wires)
 
-        return ops
+            step *= 2
 
     # --------------------------------------------------------
     # Adjoint (inverse transform)
     # --------------------------------------------------------
     def adjoint(self):
-        return qml.adjoint(DaubechiesD4)(wires=self.wires)
+        return _DaubechiesD4Adjoint(wires=self.wires)
+
+
+class _DaubechiesD4Adjoint(TemplateOperation):
+    r"""
+    Inverse Daubechies D4 transform :math:`(D_{2^n}^4)^\dagger`.
+
+    Emits the reversed gate sequence directly (inverse kernels and inverse
+    shuffles), so no operation is wrapped in ``Adjoint``.
+    """
+
+    min_wires = 2
+
+    _ops_template = staticmethod(_d4_adjoint_ops_template)
+
+    def adjoint(self):
+        return DaubechiesD4(wires=self.wires)
+
+
+# ============================================================
+# Resource registration
+# ============================================================
+
+def _d4_kernel_resources():
+    return {qml.RY: 2, qml.CZ: 1, qml.PauliX: 1, qml.CNOT: 1}
+
+
+def _d4_resources(num_wires):
+    # Each stage: one kernel per adjacent pair and one shuffle on the
+    # active wires, after which ceil(active / 2) wires remain
+    resources = {D4Kernel: 0}
+
+    active = num_wires
+    while active >= 2:
+        resources[D4Kernel] += active // 2
+
+        shuffle = resource_rep(PerfectShuffle, num_wires=active)
+        resources[shuffle] = resources.get(shuffle, 0) + 1
+
+        active = (active + 1) // 2
+
+    return resources
+
+
+def _d4_kernel_adjoint_resources():
+    return _d4_kernel_resources()
+
+
+def _d4_adjoint_resources(num_wires):
+    resources = _d4_resources(num_wires)
+    resources[_D4KernelAdjoint] = resources.pop(D4Kernel)
+    return resources
+
+
+@register_resources(_d4_kernel_resources)
+def _d4_kernel_decomposition(wires: WiresLike, **__):
+    for make, positions in _D4_KERNEL_GATES:
+        make(wires=[wires[p] for p in positions])
+
+
+@register_resources(_d4_resources)
+def _d4_decomposition(wires: WiresLike, **__):
+    for make, positions in _d4_ops_template(len(wires)):
+        make(wires=[wires[p] for p in positions])
+
+
+@register_resources(_d4_kernel_adjoint_resources)
+def _d4_kernel_adjoint_decomposition(wires: WiresLike, **__):
+    for make, positions in _D4_KERNEL_ADJOINT_GATES:
+        make(wires=[wires[p] for p in positions])
+
+
+@register_resources(_d4_adjoint_resources)
+def _d4_adjoint_decomposition(wires: WiresLike, **__):
+    for make, positions in _d4_adjoint_ops_template(len(wires)):
+        make(wires=[wires[p] for p in positions])
+
+
+add_decomps(D4Kernel, _d4_kernel_decomposition)
+add_decomps(_D4KernelAdjoint, _d4_kernel_adjoint_decomposition)
+add_decomps(DaubechiesD4, _d4_decomposition)
+add_decomps(_DaubechiesD4Adjoint, _d4_adjoint_decomposition)
@@ -4,150 +4,197 @@
 Quantum Haar Wavelet Transform (QHWT).
 
 Implements the orthonormal Haar wavelet transform as a PennyLane Operation.
-The circuit uses only Hadamard gates and Perfect Shuffle permutations,
-following the factorization used in quantum wavelet literature.
+The circuit uses Hadamard gates and Perfect Shuffle permutations, following
+the recursive factorization of Fijany & Williams (1998):
+
+    H_{2^n} = (H_{2^{n-1}} ⊕ I) · Π_{2^n} · (I ⊗ W)
+
+where W is the Hadamard. The direct sum is realized by conditioning every
+coarser level on the already transformed wires being |0⟩.
 """
 
 import functools
-import numpy as np
 
 from pennylane import math
 from pennylane.capture import enabled
-from pennylane.control_flow import for_loop
-from pennylane.decomposition import add_decomps, register_resources
-from pennylane.operation import Operation
-from pennylane.ops import Hadamard
-from pennylane.wires import Wires, WiresLike
+from pennylane.decomposition import (
+    add_decomps,
+    controlled_resource_rep,
+    register_resources,
+    resource_rep,
+)
+from pennylane.ops import Hadamard, ctrl
+from pennylane.wires import WiresLike
 
 from quantum_wavelets.permutations import PerfectShuffle
+from quantum_wavelets.utils import TemplateOperation, classical_haar_matrix
 
 
-class HaarWavelet(Operation):
-    r"""
-    HaarWavelet(wires)
+@functools.lru_cache(maxsize=None)
+def _zero_controlled(op_type, num_controls):
+    """
+    Factory for ``op_type`` acting on the trailing wires, conditioned on the
+    first ``num_controls`` wires all being |0⟩.
+    """
+    if not num_controls:
+        return op_type
 
-    Apply the quantum Haar wavelet transform (QHWT) on ``n = len(wires)`` qubits.
+    control_values = [0] * num_controls
 
-    The transform is implemented via a multiscale factorization:
-    at each scale, Hadamards are applied to a subset of wires followed by
-    a perfect shuffle permutation.
-    """
+    def make(wires):
+        controls, targets = wires[:num_controls], wires[num_controls:]
 
-    grad_method = None
-    resource_keys = {"num_wires"}
+        return ctrl(
+            op_type(wires=targets), control=controls, control_values=control_values
+        )
 
-    def __init__(self, wires: WiresLike, id=None):
-        wires = Wires(wires)
-        self.hyperparameters["n_wires"] = len(wires)
-        super().__init__(wires=wires, id=id)
+    return make
 
-    def _flatten(self):
-        return tuple(), (self.wires, tuple())
 
-    @property
-    def num_params(self):
-        return 0
+@functools.lru_cache(maxsize=None)
+def _haar_ops_template(n_wires):
+    """Gate sequence of the QHWT as ``(factory, wire positions)`` pairs."""
+    template = []
 
-    def decomposition(self):
-        return self.compute_decomposition(wires=self.wires)
+    for level in range(n_wires):
+        # Amplitudes with a 1 on wires 0 .. level - 1 are finished details
+        controls = tuple(range(level))
 
-    # ------------------------------------------------------------------
-    # Matrix (verification only)
-    # ------------------------------------------------------------------
-    @staticmethod
-    @functools.lru_cache
-    def compute_matrix(n_wires):
-        """Return the exact Haar matrix of size 2^n × 2^n (for testing)."""
-        N = 2**n_wires
+        # Sums and differences of neighbouring amplitudes
+        template.append(
+            (_zero_controlled(Hadamard, level), controls + (n_wires - 1,))
+        )
 
-        def haar_recursive(n):
-            if n == 1:
-                return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+        # Gather the sums into the |0⟩ half of the remaining wires
+        if level < n_wires - 1:
+            template.append(
+                (_zero_controlled(PerfectShuffle, level), tuple(range(n_wires)))
+            )
 
-            H_prev = haar_recursive(n - 1)
-            I = np.eye(2 ** (n - 1))
+    return tuple(template)
 
-            top = np.kron(H_prev, [1, 1])
-            bottom = np.kron(I, [1, -1])
 
-            return np.vstack([top, bottom]) / np.sqrt(2)
+@functools.lru_cache(maxsize=None)
+def _haar_adjoint_ops_template(n_wires):
+    """Gate sequence of the inverse QHWT: levels in reverse, each undone."""
+    template = []
 
-        return haar_recursive(n_wires)
+    for level in reversed(range(n_wires)):
+        controls = tuple(range(level))
 
-    # ------------------------------------------------------------------
-    # Gate-level decomposition
-    # ------------------------------------------------------------------
-    @staticmethod
-    def compute_decomposition(wires: WiresLike):
-        """
-        Decompose the Haar wavelet transform into Hadamards and PerfectShuffles.
-        """
-        wires = Wires(wires)
-        n = len(wires)
+        # Inverse perfect shuffle: the same shift on reversed wires
+        if level < n_wires - 1:
+            active = tuple(reversed(range(level, n_wires)))
+            template.append(
+                (_zero_controlled(PerfectShuffle, level), controls + active)
+            )
+
+        # Hadamards are self-inverse
+        template.append(
+            (_zero_controlled(Hadamard, level), controls + (n_wires - 1,))
+        )
+
+    return tuple(template)
 
-        ops = []
 
-        for level in range(n):
-            # Apply Hadamard on the last (n - level) wires
-            for w in wires[level:]:
-                ops.append(Hadamard(w))
+class HaarWavelet(TemplateOperation):
+    r"""
+    HaarWavelet(wires)
+
+    Apply the quantum Haar wavelet transform (QHWT) on ``n = len(wires)`` qubits.
 
-            # Apply perfect shuffle on all wires
-            ops.append(PerfectShuffle(wires=wires))
+    The transform is implemented via a multiscale factorization:
+    at each scale, a Hadamard on the last wire is followed by a perfect
+    shuffle of the remaining wires, both conditioned on the wires of the
+    finer scales being |0⟩.
+    """
 
-        return ops
+    _ops_template = staticmethod(_haar_ops_template)
 
     # ------------------------------------------------------------------
-    # qfunc decomposition (for JAX / capture)
+    # Matrix (verification only)
     # ------------------------------------------------------------------
     @staticmethod
-    def compute_qfunc_decomposition(*wires, n_wires):
-        wires = math.array(wires, like="jax")
+    @functools.lru_cache
+    def compute_matrix(n_wires):
+        """Return the exact Haar matrix of size 2^n × 2^n (for testing)."""
+        return classical_haar_matrix(n_wires)
+
+    def adjoint(self):
+        return _HaarWaveletAdjoint(wires=self.wires)
 
-        @for_loop(n_wires)
-        def outer(level):
 
-            @for_loop(n_wires - level)
-            def hadamards(i):
-                Hadamard(wires[level + i])
+class _HaarWaveletAdjoint(TemplateOperation):
+    r"""
+    Inverse quantum Haar wavelet transform.
 
-            hadamards()
+    Emits the levels of :class:`HaarWavelet` in reverse order, each as an
+    inverse perfect shuffle followed by its Hadamard, so no operation is
+    wrapped in ``Adjoint``.
+    """
 
-            PerfectShuffle(wires=wires)
+    _ops_template = staticmethod(_haar_adjoint_ops_template)
 
-        outer()
+    @staticmethod
+    @functools.lru_cache
+    def compute_matrix(n_wires):
+        # The Haar matrix is real orthogonal
+        return classical_haar_matrix(n_wires).T
 
-    @property
-    def resource_params(self):
-        return {"num_wires": len(self.wires)}
+    def adjoint(self):
+        return HaarWavelet(wires=self.wires)
 
 
 # ----------------------------------------------------------------------
 # Resource counting
 # ----------------------------------------------------------------------
+def _zero_controlled_rep(op_type, num_controls, **params):
+    if not num_controls:
+        return resource_rep(op_type, **params)
+
+    return controlled_resource_rep(
+        op_type,
+        params,
+        num_control_wires=num_controls,
+        num_zero_control_values=num_controls,
+    )
+
+
 def _haar_resources(num_wires):
-    # At level k: (n-k) Hadamards, and one PerfectShuffle
-    return {
-        Hadamard: num_wires * (num_wires + 1) // 2,
-        PerfectShuffle: num_wires,
-    }
+    # At level k: one Hadamard and, above the last level, one shuffle of
+    # the n - k remaining wires, each with k zero controls
+    resources = {}
 
+    for level in range(num_wires):
+        resources[_zero_controlled_rep(Hadamard, level)] = 1
 
-@register_resources(_haar_resources)
-def _haar_decomposition(wires: WiresLike, n_wires, **__):
+        if level < num_wires - 1:
+            shuffle = _zero_controlled_rep(
+                PerfectShuffle, level, num_wires=num_wires - level
+            )
+            resources[shuffle] = 1
 
-    @for_loop(n_wires)
-    def outer(level):
+    return resources
 
-        @for_loop(n_wires - level)
-        def hadamards(i):
-            Hadamard(wires[level + i])
 
-        hadamards()
+@register_resources(_haar_resources)
+def _haar_decomposition(wires: WiresLike, **__):
+    if enabled():
+        wires = math.array(wires, like="jax")
+
+    for make, positions in _haar_ops_template(len(wires)):
+        make(wires=[wires[p] for p in positions])
 
-        PerfectShuffle(wires=wires)
 
-    outer()
+# The inverse uses the same gates, so it shares the resource function
+@register_resources(_haar_resources)
+def _haar_adjoint_decomposition(wires: WiresLike, **__):
+    if enabled():
+        wires = math.array(wires, like="jax")
+
+    for make, positions in _haar_adjoint_ops_template(len(wires)):
+        make(wires=[wires[p] for p in positions])
 
 
 add_decomps(HaarWavelet, _haar_decomposition)
+add_decomps(_HaarWaveletAdjoint, _haar_adjoint_decomposition)
@@ -9,20 +9,81 @@ Implements:
 
 These operators are fundamental building blocks for
 quantum Haar and Daubechies wavelet transforms.
+
+On ``default.qubit`` both permutations are applied as a single transpose
+of the state tensor rather than as a SWAP network or a dense matrix.
 """
 
 import functools
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from pennylane import math
 from pennylane.capture import enabled
 from pennylane.control_flow import for_loop
 from pennylane.decomposition import add_decomps, register_resources
+from pennylane.devices.qubit.apply_operation import apply_operation
 from pennylane.operation import Operation
 from pennylane.ops import SWAP
 from pennylane.wires import Wires, WiresLike
 
 
+# ============================================================
+# Index arithmetic
+# ============================================================
+
+def _perfect_shuffle_indices(n_wires):
+    """Image of every basis index under Π_{2^n} (rotate a_0 to the top bit)."""
+    i = np.arange(2**n_wires, dtype=np.int64)
+    return ((i & 1) << (n_wires - 1)) | (i >> 1)
+
+
+# (shift, mask) pairs of the SWAR bit reversal: swap adjacent bits, then
+# bit pairs, nibbles, bytes, 16- and 32-bit halves of a 64-bit word
+_SWAR_STEPS = tuple(
+    (np.uint64(shift), np.uint64(mask))
+    for shift, mask in (
+        (1, 0x5555555555555555),
+        (2, 0x3333333333333333),
+        (4, 0x0F0F0F0F0F0F0F0F),
+        (8, 0x00FF00FF00FF00FF),
+        (16, 0x0000FFFF0000FFFF),
+        (32, 0x00000000FFFFFFFF),
+    )
+)
+
+
+def _bit_reversal_indices(n_wires):
+    """Image of every basis index under P_{2^n} (reverse all bits)."""
+    j = np.arange(2**n_wires, dtype=np.uint64)
+
+    for shift, mask in _SWAR_STEPS:
+        j = ((j & mask) << shift) | ((j >> shift) & mask)
+
+    # The full 64-bit word is reversed; keep its top n_wires bits
+    return (j >> np.uint64(64 - n_wires)).astype(np.int64)
+
+
+def _permutation_csr(j):
+    """Sparse permutation matrix with a single 1 at ``(j[i], i)`` per column."""
+    N = len(j)
+    return csr_matrix((np.ones(N), (j, np.arange(N))), shape=(N, N))
+
+
+@functools.lru_cache(maxsize=None)
+def _perfect_shuffle_ops_template(n_wires):
+    """SWAP network of Π_{2^n} as ``(factory, wire positions)`` pairs."""
+    # Swap from the last pair backwards so that a_0 bubbles up to the
+    # first wire, matching ``PerfectShuffle.compute_matrix``.
+    return tuple((SWAP, (i, i + 1)) for i in reversed(range(n_wires - 1)))
+
+
+@functools.lru_cache(maxsize=None)
+def _bit_reversal_ops_template(n_wires):
+    """SWAP network of P_{2^n}: mirror pairs from the outside in."""
+    return tuple((SWAP, (i, n_wires - i - 1)) for i in range(n_wires // 2))
+
+
 # ============================================================
 # Perfect Shuffle Π_{2^n}
 # ============================================================
@@ -63,24 +124,26 @@ class PerfectShuffle(Operation):
     def compute_matrix(n_wires):
         N = 2**n_wires
         P = np.zeros((N, N))
-
-        for i in range(N):
-            bits = format(i, f"0{n_wires}b")
-            j = int(bits[-1] + bits[:-1], 2)
-            P[j, i] = 1
+        P[_perfect_shuffle_indices(n_wires), np.arange(N)] = 1
 
         return P
 
+    # --- Sparse matrix (N nonzeros, usable at large n) ---
+    # Not cached: a CSR matrix cannot be made read-only, and the index
+    # build is a single vectorized pass.
+    @staticmethod
+    def compute_sparse_matrix(n_wires, format="csr"):
+        return _permutation_csr(_perfect_shuffle_indices(n_wires)).asformat(format)
+
     # --- Gate decomposition ---
     @staticmethod
     def compute_decomposition(wires: WiresLike):
         wires = Wires(wires)
-        ops = []
-
-        for i in range(len(wires) - 1):
-            ops.append(SWAP(wires=[wires[i], wires[i + 1]]))
 
-        return ops
+        return [
+            make(wires=wires.subset(positions))
+            for make, positions in _perfect_shuffle_ops_template(len(wires))
+        ]
 
     # --- qfunc decomposition ---
     @staticmethod
@@ -89,10 +152,15 @@ class PerfectShuffle(Operation):
 
         @for_loop(n_wires - 1)
         def swaps(i):
-            SWAP(wires=[wires[i], wires[i + 1]])
+            j = n_wires - 2 - i
+            SWAP(wires=[wires[j], wires[j + 1]])
 
         swaps()
 
+    def adjoint(self):
+        # The cyclic shift on reversed wires is the inverse shift
+        return PerfectShuffle(wires=self.wires[::-1])
+
     @property
     def resource_params(self):
         return {"num_wires": len(self.wires)}
@@ -138,25 +206,24 @@ class BitReversal(Operation):
     def compute_matrix(n_wires):
         N = 2**n_wires
         P = np.zeros((N, N))
-
-        for i in range(N):
-            bits = format(i, f"0{n_wires}b")
-            j = int(bits[::-1], 2)
-            P[j, i] = 1
+        P[_bit_reversal_indices(n_wires), np.arange(N)] = 1
 
         return P
 
+    # --- Sparse matrix (N nonzeros, usable at large n) ---
+    @staticmethod
+    def compute_sparse_matrix(n_wires, format="csr"):
+        return _permutation_csr(_bit_reversal_indices(n_wires)).asformat(format)
+
     # --- Gate decomposition ---
     @staticmethod
     def compute_decomposition(wires: WiresLike):
         wires = Wires(wires)
-        ops = []
-
-        n = len(wires)
-        for i in range(n // 2):
-            ops.append(SWAP(wires=[wires[i], wires[n - i - 1]]))
 
-        return ops
+        return [
+            make(wires=wires.subset(positions))
+            for make, positions in _bit_reversal_ops_template(len(wires))
+        ]
 
     # --- qfunc decomposition ---
     @staticmethod
@@ -169,6 +236,9 @@ class BitReversal(Operation):
 
         swaps()
 
+    def adjoint(self):
+        return BitReversal(wires=self.wires)
+
     @property
     def resource_params(self):
         return {"num_wires": len(self.wires)}
@@ -187,17 +257,28 @@ def _bit_reversal_resources(num_wires):
 
 
 @register_resources(_perfect_shuffle_resources)
-def _perfect_shuffle_decomp(wires: WiresLike, n_wires, **__):
+def _perfect_shuffle_decomp(wires: WiresLike, **__):
+    # The graph system passes resource_params, not hyperparameters
+    n_wires = len(wires)
+
+    if enabled():
+        wires = math.array(wires, like="jax")
 
     @for_loop(n_wires - 1)
     def swaps(i):
-        SWAP(wires=[wires[i], wires[i + 1]])
+        j = n_wires - 2 - i
+        SWAP(wires=[wires[j], wires[j + 1]])
 
     swaps()
 
 
 @register_resources(_bit_reversal_resources)
-def _bit_reversal_decomp(wires: WiresLike, n_wires, **__):
+def _bit_reversal_decomp(wires: WiresLike, **__):
+    # The graph system passes resource_params, not hyperparameters
+    n_wires = len(wires)
+
+    if enabled():
+        wires = math.array(wires, like="jax")
 
     @for_loop(n_wires // 2)
     def swaps(i):
@@ -208,3 +289,36 @@ def _bit_reversal_decomp(wires: WiresLike, n_wires, **__):
 
 add_decomps(PerfectShuffle, _perfect_shuffle_decomp)
 add_decomps(BitReversal, _bit_reversal_decomp)
+
+
+# ============================================================
+# State-vector fast path (default.qubit)
+# ============================================================
+
+def _permute_state_axes(state, wires, sources, is_state_batched):
+    """Move the qubit axis ``sources[k]`` onto ``wires[k]`` in one transpose."""
+    offset = int(is_state_batched)
+    axes = list(range(math.ndim(state)))
+
+    for w, src in zip(wires, sources):
+        axes[offset + w] = offset + src
+
+    return math.transpose(state, axes)
+
+
+@apply_operation.register
+def _apply_perfect_shuffle(
+    op: PerfectShuffle, state, is_state_batched: bool = False, debugger=None, **_
+):
+    # Π moves the qubit on wires[k - 1] to wires[k]
+    wires = op.wires.tolist()
+    sources = wires[-1:] + wires[:-1]
+    return _permute_state_axes(state, wires, sources, is_state_batched)
+
+
+@apply_operation.register
+def _apply_bit_reversal(
+    op: BitReversal, state, is_state_batched: bool = False, debugger=None, **_
+):
+    wires = op.wires.tolist()
+    return _permute_state_axes(state, wires, wires[::-1], is_state_batched)
@@ -5,7 +5,28 @@ This module contains internal helper functions that are
 not part of the public API.
 """
 
+import functools
+
 import numpy as np
+from pennylane import math
+from pennylane.capture import enabled
+from pennylane.operation import Operation
+from pennylane.queuing import QueuingManager
+from pennylane.wires import Wires, WiresLike
+
+from quantum_wavelets._d4_constants import UD4
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+
+def _jit(func):
+    """Compile ``func`` with numba if it is installed, else return it as is."""
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
 
 
 def is_power_of_two(n: int) -> bool:
@@ -21,25 +42,224 @@ def is_power_of_two(n: int) -> bool:
     return n > 0 and (n & (n - 1)) == 0
 
 
+def _haar_matrix_numpy(n: int) -> np.ndarray:
+    """Vectorized Haar builder used when numba is not available."""
+    N = 2**n
+    c = 1 / np.sqrt(2)
+
+    H = np.zeros((N, N), dtype=np.float64)
+    H[0, 0] = 1.0
+
+    for k in range(1, n + 1):
+        h = 2 ** (k - 1)
+        rows = np.arange(h)
+
+        H[:h, : 2 * h] = np.repeat(H[:h, :h], 2, axis=1) * c
+        H[h + rows, 2 * rows] = c
+        H[h + rows, 2 * rows + 1] = -c
+
+    return H
+
+
+@_jit
+def _haar_matrix_numba(n: int) -> np.ndarray:
+    """Loop-based Haar builder, compiled by numba."""
+    N = 2**n
+    c = 1.0 / np.sqrt(2.0)
+
+    H = np.zeros((N, N), dtype=np.float64)
+    H[0, 0] = 1.0
+
+    h = 1
+    for _ in range(n):
+        # Repeat every column of the previous level in place; walking the
+        # columns backwards never overwrites an entry still to be read.
+        for r in range(h):
+            for col in range(2 * h - 1, -1, -1):
+                H[r, col] = H[r, col // 2] * c
+
+        for r in range(h):
+            H[h + r, 2 * r] = c
+            H[h + r, 2 * r + 1] = -c
+
+        h *= 2
+
+    return H
+
+
+@functools.lru_cache(maxsize=None)
 def classical_haar_matrix(n: int) -> np.ndarray:
     """
     Construct the classical Haar matrix of size 2^n × 2^n.
 
     This function is intended for testing and verification only.
 
+    The matrix is built iteratively in a single preallocated buffer: at
+    level k the top 2^(k-1) rows are the previous level with every column
+    repeated twice (averages), and the next 2^(k-1) rows hold ±1/√2 on
+    consecutive column pairs (differences). The build runs as a compiled
+    loop when numba is installed.
+
     Args:
         n (int): Number of qubits / levels.
 
     Returns:
-        np.ndarray: Haar transform matrix.
+        np.ndarray: Haar transform matrix (read-only, shared between calls).
+    """
+    if njit is not None:
+        H = _haar_matrix_numba(n)
+    else:
+        H = _haar_matrix_numpy(n)
+
+    H.setflags(write=False)
+    return H
+
+
+@functools.lru_cache(maxsize=None)
+def d4_matrix(n: int) -> np.ndarray:
+    """
+    Construct the Daubechies D4 transform matrix of size 2^n × 2^n.
+
+    This function is intended for testing and verification only.
+
+    The kernels and shuffles of the circuit are applied directly to the
+    identity, viewed as a tensor with one axis per wire plus a column
+    axis: each 4×4 kernel is a single ``tensordot`` and each shuffle is an
+    axis transpose, so no circuit is simulated.
+
+    Args:
+        n (int): Number of qubits (at least 2).
+
+    Returns:
+        np.ndarray: D4 transform matrix (read-only, shared between calls).
+    """
+    N = 2**n
+    kernel = UD4.reshape(2, 2, 2, 2)
+
+    U = np.eye(N, dtype=np.complex128).reshape((2,) * n + (N,))
+
+    active = tuple(range(n))
+    while len(active) >= 2:
+
+        for a, b in zip(active[0:-1:2], active[1::2]):
+            U = np.tensordot(kernel, U, axes=([2, 3], [a, b]))
+            U = np.moveaxis(U, [0, 1], [a, b])
+
+        # Perfect shuffle: the qubit on active[k - 1] moves to active[k]
+        axes = list(range(n + 1))
+        for k, w in enumerate(active):
+            axes[w] = active[k - 1]
+        U = U.transpose(axes)
+
+        active = active[::2]
+
+    U = np.ascontiguousarray(U.reshape(N, N))
+    U.setflags(write=False)
+    return U
+
+
+@functools.lru_cache(maxsize=None)
+def cached_decomposition(op_type, n_wires: int) -> tuple:
+    """
+    Decomposition of ``op_type`` on the canonical wires ``0 .. n_wires - 1``.
+
+    Built once per ``(op_type, n_wires)`` without recording to any active
+    queue; use :func:`relabel_ops` to move it onto concrete wires.
+
+    Args:
+        op_type (type): Operation class with a static ``compute_decomposition``.
+        n_wires (int): Number of wires.
+
+    Returns:
+        tuple: Prototype operations on wires ``0 .. n_wires - 1``.
+    """
+    with QueuingManager.stop_recording():
+        return tuple(op_type.compute_decomposition(wires=range(n_wires)))
+
+
+def relabel_ops(ops, wires) -> list:
+    """
+    Copy prototype operations from wires ``0 .. n - 1`` onto ``wires``.
+
+    Copies are made with ``map_wires`` (no re-validation) and queued like
+    freshly constructed operations.
+
+    Args:
+        ops (Sequence[Operator]): Operations on the canonical wires.
+        wires (Wires): Target wire labels.
+
+    Returns:
+        list[Operator]: Relabelled operations.
     """
-    if n == 1:
-        return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    wire_map = dict(enumerate(wires))
+    new_ops = [op.map_wires(wire_map) for op in ops]
+
+    for op in new_ops:
+        QueuingManager.append(op)
+
+    return new_ops
+
+
+class TemplateOperation(Operation):
+    r"""
+    Parameter-free operation on any number of wires, decomposed through a
+    gate template.
+
+    Subclasses set ``_ops_template`` to a function of the number of wires
+    returning ``(factory, wire positions)`` pairs, and define ``adjoint``.
+    ``min_wires`` is the smallest register the operation accepts.
+    """
+
+    num_params = 0
+    grad_method = None
+    resource_keys = {"num_wires"}
+
+    min_wires = 1
+
+    def __init__(self, wires: WiresLike, id=None):
+        wires = Wires(wires)
+
+        if len(wires) < self.min_wires:
+            raise ValueError(
+                f"{type(self).__name__} requires at least {self.min_wires} qubits."
+            )
+
+        self.hyperparameters["n_wires"] = len(wires)
+        super().__init__(wires=wires, id=id)
+
+    def _flatten(self):
+        return tuple(), (self.wires, tuple())
+
+    def decomposition(self):
+        # Captured programs must bind freshly constructed operations
+        if enabled():
+            return self.compute_decomposition(wires=self.wires)
+
+        ops = cached_decomposition(type(self), len(self.wires))
+        return relabel_ops(ops, self.wires)
+
+    @classmethod
+    def compute_decomposition(cls, *params, wires, **kwargs):
+        """
+        Gates of the template on ``wires``.
+
+        The signature accepts ``*params`` and ``**kwargs`` so that the
+        ``n_wires`` hyperparameter may be passed along with the wires.
+        """
+        wires = Wires(wires)
+
+        return [
+            make(wires=wires.subset(positions))
+            for make, positions in cls._ops_template(len(wires))
+        ]
 
-    H_prev = classical_haar_matrix(n - 1)
-    I = np.eye(2 ** (n - 1))
+    @classmethod
+    def compute_qfunc_decomposition(cls, *wires, n_wires):
+        wires = math.array(wires, like="jax")
 
-    top = np.kron(H_prev, [1, 1])
-    bottom = np.kron(I, [1, -1])
+        for make, positions in cls._ops_template(n_wires):
+            make(wires=[wires[p] for p in positions])
 
-    return np.vstack([top, bottom]) / np.sqrt(2)
+    @property
+    def resource_params(self):
+        return {"num_wires": len(self.wires)}
@@ -0,0 +1,59 @@
+import numpy as np
+import pennylane as qml
+import pytest
+
+from quantum_wavelets._backend import PRECISION, _make_device
+
+
+@pytest.fixture
+def random_states():
+    """Factory for ``k`` Haar-random normalized states on ``n`` qubits."""
+    rng = np.random.default_rng(2511)
+
+    def make(n, k=4):
+        x = rng.normal(size=(k, 2**n)) + 1j * rng.normal(size=(k, 2**n))
+        return x / np.linalg.norm(x, axis=1, keepdims=True)
+
+    return make
+
+
+@pytest.fixture
+def graph_decomposition():
+    """Enable the graph-based decomposition system for one test."""
+    qml.decomposition.enable_graph()
+    yield
+    qml.decomposition.disable_graph()
+
+
+@pytest.fixture
+def assert_unitary_action(random_states):
+    """
+    Check that an operator acts unitarily without building its matrix.
+
+    Applies the operator to a few random states and verifies that norms
+    and pairwise overlaps are preserved: O(2^n) work per state instead
+    of the O(4^n) of ``qml.matrix``.
+    """
+    atol = 100 * np.finfo(PRECISION).eps
+
+    def check(op_class, n, k=4):
+        wires = list(range(n))
+        dev = _make_device(n)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.StatePrep(x, wires=wires)
+            op_class(wires=wires)
+            return qml.state()
+
+        xs = random_states(n, k)
+        outs = [circuit(x) for x in xs]
+
+        for i in range(k):
+            assert np.isclose(np.linalg.norm(outs[i]), 1.0, atol=atol)
+
+            for j in range(i):
+                overlap = np.vdot(outs[j], outs[i])
+                assert np.isclose(overlap, np.vdot(xs[j], xs[i]), atol=atol)
+
+    return check
@@ -1,6 +1,11 @@
 import numpy as np
 import pennylane as qml
-from quantum_wavelets.daubechies_d4 import DaubechiesD4
+import pytest
+
+from quantum_wavelets import _d4_constants
+from quantum_wavelets._backend import _make_device
+from quantum_wavelets.daubechies_d4 import UD4, D4Kernel, DaubechiesD4
+from quantum_wavelets.utils import d4_matrix
 
 
 def test_d4_unitary_n2():
@@ -15,20 +20,12 @@ def test_d4_unitary_n2():
     assert np.allclose(U.conj().T @ U, np.eye(4))
 
 
-def test_d4_unitary_n3():
-    dev = qml.device("default.qubit", wires=3)
-
-    @qml.qnode(dev)
-    def circuit():
-        DaubechiesD4(wires=[0, 1, 2])
-        return qml.state()
-
-    U = qml.matrix(circuit)()
-    assert np.allclose(U.conj().T @ U, np.eye(8))
+def test_d4_unitary_state_sweep(assert_unitary_action):
+    assert_unitary_action(DaubechiesD4, n=6)
 
 
 def test_d4_norm_preserved():
-    dev = qml.device("default.qubit", wires=4)
+    dev = _make_device(4)
 
     @qml.qnode(dev)
     def circuit():
@@ -38,3 +35,111 @@ def test_d4_norm_preserved():
 
     state = circuit()
     assert np.isclose(np.linalg.norm(state), 1.0)
+
+
+def test_d4_norm_preserved_qjit():
+    """Compile once with Catalyst and sweep over all basis states."""
+    pytest.importorskip("catalyst")
+
+    n = 4
+    dev = _make_device(n)
+
+    @qml.qjit(static_argnums=1)
+    @qml.qnode(dev)
+    def circuit(x, wires):
+        qml.StatePrep(x, wires=wires)
+        DaubechiesD4(wires=wires)
+        return qml.state()
+
+    for i in range(2**n):
+        x = np.zeros(2**n)
+        x[i] = 1.0
+
+        state = circuit(x, tuple(range(n)))
+        assert np.isclose(np.linalg.norm(state), 1.0)
+
+
+def test_d4_kernel_decomposition_matches_ud4():
+    """Analytic RY/CZ/X/CNOT decomposition of the D4 kernel equals UD4."""
+    ops = D4Kernel.compute_decomposition(wires=[0, 1])
+    U = qml.matrix(qml.tape.QuantumScript(ops), wire_order=[0, 1])
+
+    assert np.allclose(U, UD4)
+
+
+def test_d4_matrix_matches_decomposition():
+    """Direct tensor construction equals the product of the decomposed gates."""
+    for n in range(2, 6):
+        wires = list(range(n))
+        ops = DaubechiesD4.compute_decomposition(wires=wires)
+        U = qml.matrix(qml.tape.QuantumScript(ops), wire_order=wires)
+
+        assert np.allclose(d4_matrix(n), U)
+
+
+def test_d4_graph_decomposition_matches_matrix(graph_decomposition):
+    """Registered rules reduce D4 (kernels and shuffles) to native gates."""
+    n = 4
+    wires = list(range(n))
+    tape = qml.tape.QuantumScript([DaubechiesD4(wires=wires)])
+
+    (new_tape,), _ = qml.transforms.decompose(
+        tape, gate_set={qml.RY, qml.CZ, qml.PauliX, qml.CNOT, qml.SWAP}
+    )
+    U = qml.matrix(new_tape, wire_order=wires)
+
+    names = {op.name for op in new_tape.operations}
+    assert names <= {"RY", "CZ", "PauliX", "CNOT", "SWAP"}
+    assert np.allclose(U, d4_matrix(n))
+
+
+def test_d4_adjoint_decomposition_inverts_transform():
+    """The adjoint expands to plain gates whose product is the inverse."""
+    for n in range(2, 6):
+        wires = list(range(n))
+        ops = DaubechiesD4(wires=wires).adjoint().decomposition()
+        U = qml.matrix(qml.tape.QuantumScript(ops), wire_order=wires)
+
+        assert not any(isinstance(op, qml.ops.Adjoint) for op in ops)
+        assert np.allclose(U @ d4_matrix(n), np.eye(2**n))
+
+
+def test_d4_constants_match_closed_forms():
+    """Literal D4 constants agree with their defining expressions."""
+    c = _d4_constants
+    h = (np.array([1, 3, 3, 1]) + np.array([1, 1, -1, -1]) * np.sqrt(3)) / (4 * np.sqrt(2))
+
+    assert np.allclose([c.h0, c.h1, c.h2, c.h3], h, rtol=0, atol=1e-16)
+
+    # UD4 = (I ⊗ RY(THETA1)) · Q · (I ⊗ RY(THETA0)), Q the signed cyclic down-shift
+    Q = np.zeros((4, 4))
+    Q[3, 0] = Q[0, 1] = Q[1, 2] = 1
+    Q[2, 3] = -1
+    I = np.eye(2)
+    C0 = qml.RY(c.THETA0, wires=0).matrix()
+    C1 = qml.RY(c.THETA1, wires=0).matrix()
+
+    assert np.allclose(np.kron(I, C1) @ Q @ np.kron(I, C0), c.UD4)
+
+
+def test_d4_adjoint_graph_decomposition(graph_decomposition):
+    """The registered inverse rules undo the transform under graph mode."""
+    n = 4
+    wires = list(range(n))
+    tape = qml.tape.QuantumScript([DaubechiesD4(wires=wires).adjoint()])
+
+    (new_tape,), _ = qml.transforms.decompose(
+        tape, gate_set={qml.RY, qml.CZ, qml.PauliX, qml.CNOT, qml.SWAP}
+    )
+    U = qml.matrix(new_tape, wire_order=wires)
+
+    assert np.allclose(U @ d4_matrix(n), np.eye(2**n))
+
+
+def test_d4_rejects_single_wire():
+    """Forward and inverse transforms need two wires and name themselves."""
+    from quantum_wavelets.daubechies_d4 import _DaubechiesD4Adjoint
+
+    for op_type in (DaubechiesD4, _DaubechiesD4Adjoint):
+        with pytest.raises(ValueError, match=f"{op_type.__name__} requires at least 2"):
+            op_type(wires=[0])
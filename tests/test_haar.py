@@ -1,18 +1,21 @@
 import numpy as np
 import pennylane as qml
 
+from quantum_wavelets._backend import PRECISION, _make_device
 from quantum_wavelets.haar import HaarWavelet
+from quantum_wavelets.utils import (
+    _haar_matrix_numba,
+    _haar_matrix_numpy,
+    classical_haar_matrix,
+)
 
+# Simulator results are only as exact as the state-vector precision
+ATOL = 10 * np.finfo(PRECISION).eps
 
-def test_haar_unitary():
-    """Test that HaarWavelet is unitary."""
-    n = 3
-    wires = list(range(n))
-
-    U = qml.matrix(HaarWavelet(wires=wires))
-    I = np.eye(2**n)
 
-    assert np.allclose(U.conj().T @ U, I)
+def test_haar_unitary(assert_unitary_action):
+    """Test that HaarWavelet is unitary."""
+    assert_unitary_action(HaarWavelet, n=6)
 
 
 def test_haar_inverse_identity():
@@ -20,7 +23,7 @@ def test_haar_inverse_identity():
     n = 3
     wires = list(range(n))
 
-    dev = qml.device("default.qubit", wires=n)
+    dev = _make_device(n)
 
     @qml.qnode(dev)
     def circuit():
@@ -33,7 +36,7 @@ def test_haar_inverse_identity():
     expected = np.zeros(2**n)
     expected[4] = 1.0  # |100⟩
 
-    assert np.allclose(state, expected)
+    assert np.allclose(state, expected, atol=ATOL)
 
 
 def test_haar_matches_matrix_small_n():
@@ -41,7 +44,7 @@ def test_haar_matches_matrix_small_n():
     n = 2
     wires = list(range(n))
 
-    dev = qml.device("default.qubit", wires=n)
+    dev = _make_device(n)
 
     x = np.array([1.0, 0.0, 0.0, 0.0])
 
@@ -56,4 +59,69 @@ def test_haar_matches_matrix_small_n():
     U = HaarWavelet.compute_matrix(n)
     state_matrix = U @ x
 
-    assert np.allclose(state_circuit, state_matrix)
+    assert np.allclose(state_circuit, state_matrix, atol=ATOL)
+
+
+def test_haar_matrix_matches_kron_definition():
+    """Iterative Haar matrix equals the recursive Kronecker definition."""
+    H = np.array([[1.0]])
+    for n in range(1, 6):
+        top = np.kron(H, [1, 1])
+        bottom = np.kron(np.eye(2 ** (n - 1)), [1, -1])
+        H = np.vstack([top, bottom]) / np.sqrt(2)
+
+        assert np.allclose(HaarWavelet.compute_matrix(n), H)
+
+
+def test_haar_matrix_builders_agree():
+    """The loop builder (compiled or plain Python) equals the vectorized one."""
+    for n in range(0, 7):
+        assert np.allclose(_haar_matrix_numba(n), _haar_matrix_numpy(n), rtol=0, atol=1e-15)
+
+
+def test_haar_matrix_matches_decomposition():
+    """The gates of the forward and inverse transforms multiply to the matrix."""
+    for n in range(1, 6):
+        wires = list(range(n))
+        H = classical_haar_matrix(n)
+
+        op = HaarWavelet(wires=wires)
+
+        for op, expected in ((op, H), (op.adjoint(), H.T)):
+            tape = qml.tape.QuantumScript(op.decomposition())
+            U = qml.matrix(tape, wire_order=wires)
+
+            assert np.allclose(U, expected)
+
+
+def test_haar_decomposition_cache_relabels_wires():
+    """Cached decompositions are relabelled copies, never shared instances."""
+    wires = ["a", "b", "c"]
+    op = HaarWavelet(wires=wires)
+
+    first = op.decomposition()
+    second = op.decomposition()
+    expected = HaarWavelet.compute_decomposition(wires=wires)
+
+    assert len(first) == len(expected)
+    assert all(qml.equal(a, b) for a, b in zip(first, expected))
+    assert all(a is not b for a, b in zip(first, second))
+
+
+def test_haar_graph_decomposition(graph_decomposition):
+    """Registered rules reduce both directions to native gates exactly."""
+    n = 3
+    wires = list(range(n))
+    H = classical_haar_matrix(n)
+    gate_set = {qml.RY, qml.RZ, qml.CNOT, qml.GlobalPhase}
+
+    op = HaarWavelet(wires=wires)
+
+    for op, expected in ((op, H), (op.adjoint(), H.T)):
+        tape = qml.tape.QuantumScript([op])
+        (new_tape,), _ = qml.transforms.decompose(tape, gate_set=gate_set)
+        U = qml.matrix(new_tape, wire_order=wires)
+
+        names = {op.name for op in new_tape.operations}
+        assert names <= {"RY", "RZ", "CNOT", "GlobalPhase"}
+        assert np.allclose(U, expected)
@@ -1,29 +1,19 @@
 import numpy as np
 import pennylane as qml
+from pennylane.devices.qubit.apply_operation import apply_operation
 
+from quantum_wavelets._backend import _make_device
 from quantum_wavelets.permutations import PerfectShuffle, BitReversal
 
 
-def test_perfect_shuffle_unitary():
+def test_perfect_shuffle_unitary(assert_unitary_action):
     """PerfectShuffle should be unitary."""
-    n = 3
-    wires = list(range(n))
-
-    U = qml.matrix(PerfectShuffle(wires=wires))
-    I = np.eye(2**n)
-
-    assert np.allclose(U.conj().T @ U, I)
+    assert_unitary_action(PerfectShuffle, n=6)
 
 
-def test_bit_reversal_unitary():
+def test_bit_reversal_unitary(assert_unitary_action):
     """BitReversal should be unitary."""
-    n = 3
-    wires = list(range(n))
-
-    U = qml.matrix(BitReversal(wires=wires))
-    I = np.eye(2**n)
-
-    assert np.allclose(U.conj().T @ U, I)
+    assert_unitary_action(BitReversal, n=6)
 
 
 def test_perfect_shuffle_action_on_basis():
@@ -32,7 +22,7 @@ def test_perfect_shuffle_action_on_basis():
 
     |100⟩ → |010⟩ under perfect shuffle.
     """
-    dev = qml.device("default.qubit", wires=3)
+    dev = _make_device(3)
 
     @qml.qnode(dev)
     def circuit():
@@ -54,7 +44,7 @@ def test_bit_reversal_action_on_basis():
 
     |100⟩ → |001⟩ under bit reversal.
     """
-    dev = qml.device("default.qubit", wires=3)
+    dev = _make_device(3)
 
     @qml.qnode(dev)
     def circuit():
@@ -77,7 +67,7 @@ def test_permutation_matrix_vs_circuit():
     n = 3
     wires = list(range(n))
 
-    dev = qml.device("default.qubit", wires=n)
+    dev = _make_device(n)
 
     x = np.zeros(2**n)
     x[4] = 1.0  # |100⟩
@@ -93,3 +83,60 @@ def test_permutation_matrix_vs_circuit():
     state_matrix = U @ x
 
     assert np.allclose(state_circuit, state_matrix)
+
+
+def test_permutation_matrices_match_bit_strings():
+    """Vectorized permutation matrices agree with the bit-string definitions."""
+    for n in range(1, 6):
+        N = 2**n
+        shuffle = np.zeros((N, N))
+        reverse = np.zeros((N, N))
+
+        for i in range(N):
+            bits = format(i, f"0{n}b")
+            shuffle[int(bits[-1] + bits[:-1], 2), i] = 1
+            reverse[int(bits[::-1], 2), i] = 1
+
+        assert np.array_equal(PerfectShuffle.compute_matrix(n), shuffle)
+        assert np.array_equal(BitReversal.compute_matrix(n), reverse)
+
+
+def test_sparse_matrix_matches_dense():
+    """Sparse permutation matrices hold the same entries as the dense ones."""
+    n = 4
+    wires = list(range(n))
+
+    for op in (PerfectShuffle(wires=wires), BitReversal(wires=wires)):
+        S = op.sparse_matrix()
+
+        assert S.nnz == 2**n
+        assert np.array_equal(S.toarray(), qml.matrix(op))
+
+
+def test_sparse_matrix_is_not_shared():
+    """Editing a returned sparse matrix does not affect later calls."""
+    wires = [0, 1, 2]
+
+    for op_type in (PerfectShuffle, BitReversal):
+        S = op_type(wires=wires).sparse_matrix()
+        S.data[:] = 0
+
+        assert np.array_equal(op_type(wires=wires).sparse_matrix().toarray(), op_type.compute_matrix(3))
+
+
+def test_state_fast_path_matches_matrix(random_states):
+    """Transposing the state tensor agrees with the permutation matrices."""
+    n = 5
+    wires = [3, 0, 4, 1]
+    xs = random_states(n, k=3)
+    states = xs.reshape((3,) + (2,) * n)
+
+    for op in (PerfectShuffle(wires=wires), BitReversal(wires=wires)):
+        U = qml.matrix(op, wire_order=range(n))
+        expected = xs @ U.T
+
+        single = apply_operation(op, states[0])
+        batched = apply_operation(op, states, is_state_batched=True)
+
+        assert np.allclose(single.reshape(-1), expected[0])
+        assert np.allclose(batched.reshape(3, -1), expected)
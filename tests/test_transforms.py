@@ -0,0 +1,75 @@
+import numpy as np
+import pennylane as qml
+
+from quantum_wavelets import absorb_shuffles, optimize_pipeline
+from quantum_wavelets.daubechies_d4 import DaubechiesD4
+from quantum_wavelets.permutations import PerfectShuffle
+
+
+def test_absorb_shuffles_preserves_state(random_states):
+    """Relabelling wires (plus final reordering) leaves the state unchanged."""
+    n = 4
+    wires = list(range(n))
+    (x,) = random_states(n, k=1)
+
+    dev = qml.device("default.qubit", wires=n)
+
+    def circuit():
+        qml.StatePrep(x, wires=wires)
+        DaubechiesD4(wires=wires)
+        return qml.state()
+
+    expected = qml.QNode(circuit, dev)()
+    state = absorb_shuffles(qml.QNode(circuit, dev))()
+
+    assert np.allclose(state, expected)
+
+
+def test_absorb_shuffles_relabels_measurements(random_states):
+    """With wire-specific measurements no SWAPs or shuffles remain."""
+    n = 5
+    wires = list(range(n))
+    (x,) = random_states(n, k=1)
+
+    tape = qml.tape.QuantumScript(
+        [qml.StatePrep(x, wires=wires), DaubechiesD4(wires=wires)],
+        [qml.probs(wires=wires)],
+    )
+    (new_tape,), _ = absorb_shuffles(tape)
+
+    assert not any(
+        isinstance(op, (PerfectShuffle, qml.SWAP)) for op in new_tape.operations
+    )
+
+    dev = qml.device("default.qubit", wires=n)
+    expected, result = qml.execute([tape, new_tape], dev)
+
+    assert np.allclose(result, expected)
+
+
+def test_optimize_pipeline_cancels_round_trip_swaps():
+    """A perfect shuffle and its inverse cancel down to an empty circuit."""
+    n = 4
+    wires = list(range(n))
+
+    tape = qml.tape.QuantumScript(
+        [PerfectShuffle(wires=wires), qml.adjoint(PerfectShuffle(wires=wires))],
+        [qml.state()],
+    )
+    (new_tape,), _ = optimize_pipeline(tape)
+
+    assert new_tape.operations == []
+
+
+def test_optimize_pipeline_cancels_d4_round_trip():
+    """The rotations of the D4 kernels and their inverses merge away."""
+    n = 4
+    wires = list(range(n))
+
+    tape = qml.tape.QuantumScript(
+        [DaubechiesD4(wires=wires), qml.adjoint(DaubechiesD4(wires=wires))],
+        [qml.state()],
+    )
+    (new_tape,), _ = optimize_pipeline(tape)
+
+    assert new_tape.operations == []